@@ -2,14 +2,17 @@
 
 import enum
 
-class Method(enum.Enum):
-    GET = 1 
-    POST = 2 
-    PUT = 3 
+class Method(enum.IntEnum):
+    GET = 1
+    POST = 2
+    PUT = 3
     DELETE = 4
 
 
 class HttpClient:
-    def send_request(self, url: str, method: Method, data: dict, headers: dict = None) -> object: 
+    def send_request(self, url: str, method: Method, data: dict, headers: dict = None) -> object:
         raise NotImplementedError()
 
+    async def send_request_async(self, url: str, method: Method, data: dict, headers: dict = None) -> object:
+        return self.send_request(url, method, data, headers)
+
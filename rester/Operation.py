@@ -1,9 +1,34 @@
 
+import itertools
+
 from rester import HttpClient
 
+_op_kinds = itertools.count(1)
+
 class Operation:
+    __slots__ = ()
+    OP_KIND = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.OP_KIND = next(_op_kinds)
+
     def perform(self, http: HttpClient):
         raise NotImplementedError()
-    
+
+    async def aperform(self, http: HttpClient):
+        self.perform(http)
+
+    def compile(self, context: dict):
+        return None
+
+    def perform_compiled(self, http: HttpClient):
+        plan = self.compile({"baseurl": "", "headers": None})
+        if plan is None:
+            self.perform(http)
+            return
+        for op, url, method, data, headers in plan:
+            op.result = http.send_request(url, method, data, headers)
+
     def get_result(self):
         return None
\ No newline at end of file
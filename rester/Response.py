@@ -0,0 +1,41 @@
+
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+_UNPARSED = object()
+
+
+class Response:
+    __slots__ = ("_raw", "_parsed", "status_code", "headers")
+
+    def __init__(self, raw, status_code=200, headers=None):
+        self._raw = raw
+        self._parsed = _UNPARSED
+        self.status_code = status_code
+        self.headers = {} if headers is None else headers
+
+    @property
+    def raw(self):
+        return self._raw
+
+    @property
+    def text(self):
+        return self._raw.decode() if isinstance(self._raw, bytes) else self._raw
+
+    def json(self):
+        if self._parsed is _UNPARSED:
+            self._parsed = _loads(self._raw)
+        return self._parsed
+
+    def __eq__(self, other):
+        if isinstance(other, Response):
+            return self._raw == other._raw
+        return self.text == other
+
+    def __hash__(self):
+        return hash(self._raw)
@@ -1,2 +1,3 @@
-from  .HttpClient import * 
-from .Operation import * 
+from  .HttpClient import *
+from .Operation import *
+from .Response import *
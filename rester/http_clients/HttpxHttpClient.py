@@ -0,0 +1,42 @@
+
+
+import httpx
+
+from rester import HttpClient, Response
+
+
+class HttpxHttpClient(HttpClient):
+    def __init__(self, max_connections=16, max_keepalive_connections=16):
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections)
+        try:
+            http2 = True
+            self.client = httpx.Client(http2=True, limits=limits)
+        except ImportError:
+            http2 = False
+            self.client = httpx.Client(limits=limits)
+        self.aclient = httpx.AsyncClient(http2=http2, limits=limits)
+
+    def send_request(self, url, method, data, headers=None):
+        response = self.client.request(method.name, url, json=data or None, headers=headers)
+        return Response(response.content, response.status_code, response.headers)
+
+    async def send_request_async(self, url, method, data, headers=None):
+        response = await self.aclient.request(method.name, url, json=data or None, headers=headers)
+        return Response(response.content, response.status_code, response.headers)
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclient.aclose()
@@ -0,0 +1,51 @@
+
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from rester import HttpClient, Method, Response
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import brotli
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    try:
+        import brotlicffi
+        _ACCEPT_ENCODING = "br, gzip"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip"
+
+
+class RequestsHttpClient(HttpClient):
+    def __init__(self, pool_connections=32, pool_maxsize=64, retries=3):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=retries, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.default_headers = {"Accept-Encoding": _ACCEPT_ENCODING}
+        self.dispatch = {
+            Method.GET: self.session.get,
+            Method.POST: self.session.post,
+            Method.PUT: self.session.put,
+            Method.DELETE: self.session.delete,
+        }
+
+    def send_request(self, url, method, data, headers=None):
+        body = None
+        if data:
+            body = _dumps(data)
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        headers = {**self.default_headers, **(headers or {})}
+        response = self.dispatch[method](url, data=body, headers=headers)
+        return Response(response.content, response.status_code, response.headers)
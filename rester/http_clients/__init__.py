@@ -0,0 +1,10 @@
+
+try:
+    from .RequestsHttpClient import *
+except ImportError:
+    pass
+
+try:
+    from .HttpxHttpClient import *
+except ImportError:
+    pass
@@ -1,10 +1,14 @@
 
 
+import sys
+
 from rester import HttpClient
 
 class WithBaseUrl(HttpClient):
+    __slots__ = ("http", "baseurl")
+
     def __init__(self, http, baseurl):
         self.http = http
-        self.baseurl = baseurl
+        self.baseurl = sys.intern(baseurl)
     def send_request(self, url, method, data, headers):
-        return self.http.send_request(self.baseurl + url, method, data, headers)
\ No newline at end of file
+        return self.http.send_request(f"{self.baseurl}{url}", method, data, headers)
@@ -0,0 +1,47 @@
+
+
+import dbm
+import json
+import os
+
+from rester import HttpClient, Method, Response
+
+
+class ETagCache:
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".rester-cache")
+        self.db = dbm.open(path, "c")
+
+    def get(self, method, url):
+        raw = self.db.get("%s %s" % (method, url))
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry["etag"], entry["body"]
+
+    def put(self, method, url, etag, body):
+        self.db["%s %s" % (method, url)] = json.dumps({"etag": etag, "body": body})
+
+
+class WithETagCache(HttpClient):
+    __slots__ = ("http", "cache")
+
+    def __init__(self, http, cache=None):
+        self.http = http
+        self.cache = cache if cache is not None else ETagCache()
+
+    def send_request(self, url, method, data, headers=None):
+        if method != Method.GET:
+            return self.http.send_request(url, method, data, headers)
+        entry = self.cache.get(method.name, url)
+        if entry is not None:
+            headers = dict(headers or {})
+            headers["If-None-Match"] = entry[0]
+        response = self.http.send_request(url, method, data, headers)
+        if entry is not None and getattr(response, "status_code", None) == 304:
+            return Response(entry[1], 200, {"ETag": entry[0]})
+        etag = getattr(response, "headers", {}).get("ETag")
+        if etag is not None:
+            self.cache.put(method.name, url, etag, getattr(response, "text", response))
+        return response
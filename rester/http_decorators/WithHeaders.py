@@ -1,12 +1,19 @@
 
 
+from collections import ChainMap
+from types import MappingProxyType
+
 from rester import HttpClient
 
 class WithHeaders(HttpClient):
+    __slots__ = ("http", "headers")
+
     def __init__(self, http, headers):
         self.headers = headers
         self.http = http
     def send_request(self, url, method, data, headers=None):
         if headers is None:
             headers = self.headers
-        self.http.send_request(url, method, data, headers)
\ No newline at end of file
+        else:
+            headers = MappingProxyType(ChainMap(headers, self.headers))
+        return self.http.send_request(url, method, data, headers)
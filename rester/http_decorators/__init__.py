@@ -1,3 +1,4 @@
 
-from .WithBaseUrl import * 
-from .WithHeaders import * 
\ No newline at end of file
+from .WithBaseUrl import *
+from .WithHeaders import *
+from .WithETagCache import *
\ No newline at end of file
@@ -10,6 +10,5 @@ class BearerAuthOperation(Operation):
     def perform(self, http):
         self.auth_request.perform(http)
         result = self.auth_request.get_result()
-        self.request.perform(WithHeaders(http, {
-            "Authorization": "%s %s" % (self.prefix, result)
-        }))
\ No newline at end of file
+        self.auth_headers = {"Authorization": f"{self.prefix} {result}"}
+        self.request.perform(WithHeaders(http, self.auth_headers))
\ No newline at end of file
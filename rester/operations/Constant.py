@@ -3,6 +3,8 @@ from rester import Operation
 
 
 class Constant(Operation):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
     
@@ -10,4 +12,7 @@ class Constant(Operation):
         return self.value
     
     def perform(self, http):
-        pass
\ No newline at end of file
+        pass
+
+    def compile(self, context):
+        return []
\ No newline at end of file
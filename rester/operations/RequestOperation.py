@@ -4,13 +4,26 @@ from rester import HttpClient
 from rester import Method 
 
 class RequestOperation(Operation):
-    def __init__(self, url: str, method: Method, data={}, headers=None):
-        self.url = url 
-        self.method = method 
-        self.data = data
+    __slots__ = ("url", "method", "data", "headers", "result")
+
+    def __init__(self, url: str, method: Method, data=None, headers=None):
+        self.url = url
+        self.method = method
+        self.data = {} if data is None else data
         self.headers = headers
+        self.result = None
     def perform(self, http: HttpClient):
         self.result = http.send_request(self.url, self.method, self.data, self.headers)
-    
+
+    async def aperform(self, http: HttpClient):
+        self.result = await http.send_request_async(self.url, self.method, self.data, self.headers)
+
+    def compile(self, context):
+        url = context.get("baseurl", "") + self.url
+        headers = self.headers
+        if headers is None:
+            headers = context.get("headers")
+        return [(self, url, self.method, self.data, headers)]
+
     def get_result(self):
         return self.result
\ No newline at end of file
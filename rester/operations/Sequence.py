@@ -1,15 +1,77 @@
 
+import asyncio
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
 from rester import Operation
 from rester.http_decorators import WithBaseUrl
+from rester.operations.RequestOperation import RequestOperation
+
+_GET_RESULT = operator.methodcaller("get_result")
 
 
 class Sequence(Operation):
-    def __init__(self, sequence, baseurl=""):
+    __slots__ = ("sequence", "baseurl", "concurrency", "_results", "_urls", "_homogeneous")
+
+    def __init__(self, sequence, baseurl="", concurrency=1):
         self.sequence = sequence
         self.baseurl = baseurl
-    
+        self.concurrency = concurrency
+        self._results = None
+        kind = RequestOperation.OP_KIND
+        self._urls = [baseurl + x.url if x.OP_KIND == kind else None for x in sequence]
+        self._homogeneous = bool(sequence) \
+            and all(x.OP_KIND == kind for x in sequence) \
+            and len(set(x.method for x in sequence)) == 1
+
     def perform(self,http):
+        results = [None] * len(self.sequence)
+        if self._homogeneous and self.concurrency == 1:
+            method = self.sequence[0].method
+            for i, x in enumerate(self.sequence):
+                x.result = results[i] = http.send_request(self._urls[i], method, x.data, x.headers)
+            self._results = results
+        elif self.concurrency > 1:
+            target = WithBaseUrl(http, self.baseurl) if self.baseurl else http
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = [executor.submit(x.perform, target) for x in self.sequence]
+                for i, future in enumerate(futures):
+                    future.result()
+                    results[i] = self.sequence[i].get_result()
+            self._results = results
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.aperform(http))
+            else:
+                target = WithBaseUrl(http, self.baseurl) if self.baseurl else http
+                for i, x in enumerate(self.sequence):
+                    x.perform(target)
+                    results[i] = x.get_result()
+                self._results = results
+
+    async def aperform(self, http):
+        target = WithBaseUrl(http, self.baseurl) if self.baseurl else http
+        await asyncio.gather(*(x.aperform(target) for x in self.sequence))
+        results = [None] * len(self.sequence)
+        for i, x in enumerate(self.sequence):
+            results[i] = x.get_result()
+        self._results = results
+
+    def compile(self, context):
+        self._results = None
+        if self.baseurl:
+            context = dict(context, baseurl=context.get("baseurl", "") + self.baseurl)
+        plan = []
         for x in self.sequence:
-            x.perform(WithBaseUrl(http, self.baseurl))
+            sub = x.compile(context)
+            if sub is None:
+                return None
+            plan.extend(sub)
+        return plan
+
     def get_result(self):
-        return list(x.get_result() for x in self.sequence)
\ No newline at end of file
+        if self._results is None:
+            self._results = list(map(_GET_RESULT, self.sequence))
+        return self._results
@@ -1,7 +1,10 @@
 
-from unittest import TestCase 
-from rester import HttpClient, Method 
-from unittest import mock 
+import asyncio
+import json
+from unittest import TestCase, skipIf
+from rester import HttpClient, Method, Response
+from rester import http_clients
+from unittest import mock
 
 from rester import Operation
 from rester.operations import RequestOperation, BearerAuthOperation, Constant, Sequence
@@ -85,6 +88,68 @@ class TestBasic(TestCase):
         self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, None)
     
 
+    def test_nested_sequence_under_sync_operation(self):
+        inner = Sequence([
+            RequestOperation("http://auth/login", Method.POST, {"user": "x"}),
+            RequestOperation("http://auth/me", Method.GET)
+        ])
+        s = Sequence([BearerAuthOperation(Constant("token"), inner)])
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform(self.http)
+        self.assertSequenceEqual(inner.get_result(), ["x", "x"])
+
+    def test_sequence_does_not_mutate_child_urls(self):
+        op = RequestOperation("/a/", Method.GET)
+        Sequence([op], "http://localhost")
+        s = Sequence([op], "http://localhost")
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform(self.http)
+        self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, None)
+        self.assertEqual(op.url, "/a/")
+
+    def test_sequence_perform_compiled(self):
+        s = Sequence([
+            RequestOperation("/a/", Method.GET),
+            RequestOperation("/b/", Method.GET)
+        ], "http://localhost")
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform_compiled(self.http)
+        self.assertSequenceEqual(s.get_result(), ["x", "x"])
+        self.http.send_request.assert_called_with("http://localhost/b/", Method.GET, {}, None)
+
+    def test_sequence_perform_compiled_nested_baseurl(self):
+        inner = Sequence([RequestOperation("/x/", Method.GET)], "/api")
+        s = Sequence([inner], "http://localhost")
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform_compiled(self.http)
+        self.http.send_request.assert_called_with("http://localhost/api/x/", Method.GET, {}, None)
+        self.assertSequenceEqual(s.get_result(), [["x"]])
+
+    def test_sequence_perform_compiled_refreshes_cached_results(self):
+        s = Sequence([RequestOperation("/a/", Method.GET)], "http://localhost")
+        self.assertSequenceEqual(s.get_result(), [None])
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform_compiled(self.http)
+        self.assertSequenceEqual(s.get_result(), ["x"])
+
+    def test_sequence_async_perform(self):
+        s = Sequence([
+            RequestOperation("/a/", Method.GET),
+            RequestOperation("/b/", Method.GET)
+        ], "http://localhost")
+        self.http.send_request = mock.MagicMock(return_value="x")
+        asyncio.run(s.aperform(self.http))
+        self.assertSequenceEqual(s.get_result(), ["x", "x"])
+
+    def test_sequence_thread_pool_perform(self):
+        s = Sequence([
+            RequestOperation("/a/", Method.GET),
+            RequestOperation("/b/", Method.GET)
+        ], "http://localhost", concurrency=2)
+        self.http.send_request = mock.MagicMock(return_value="x")
+        s.perform(self.http)
+        self.assertSequenceEqual(s.get_result(), ["x", "x"])
+
     def test_http_decorators_with_baseurl(self):
         WithBaseUrl(self.http, "http://localhost").send_request("/a/", Method.GET, {}, None)
         self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, None)
@@ -96,4 +161,70 @@ class TestBasic(TestCase):
 
         self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, {
             "A": "B"
-        })
\ No newline at end of file
+        })
+
+    @skipIf(not hasattr(http_clients, "RequestsHttpClient"), "requests not installed")
+    def test_requests_http_client_request_composition(self):
+        client = http_clients.RequestsHttpClient()
+        response = mock.MagicMock(content=b"ok")
+        client.dispatch = {
+            Method.GET: mock.MagicMock(return_value=response),
+            Method.POST: mock.MagicMock(return_value=response),
+        }
+        self.assertEqual(client.send_request("http://localhost/x", Method.POST, {"a": 1}, None), "ok")
+        args, kwargs = client.dispatch[Method.POST].call_args
+        self.assertEqual(args, ("http://localhost/x",))
+        self.assertEqual(json.loads(kwargs["data"]), {"a": 1})
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertIn("gzip", kwargs["headers"]["Accept-Encoding"])
+        client.send_request("http://localhost/x", Method.GET, {}, None)
+        args, kwargs = client.dispatch[Method.GET].call_args
+        self.assertIsNone(kwargs["data"])
+        self.assertNotIn("Content-Type", kwargs["headers"])
+
+    @skipIf(not hasattr(http_clients, "HttpxHttpClient"), "httpx not installed")
+    def test_httpx_http_client_request_composition(self):
+        client = http_clients.HttpxHttpClient()
+        response = mock.MagicMock(content=b"ok")
+        client.client = mock.MagicMock()
+        client.client.request = mock.MagicMock(return_value=response)
+        self.assertEqual(client.send_request("http://localhost/x", Method.GET, {}, None), "ok")
+        client.client.request.assert_called_with("GET", "http://localhost/x", json=None, headers=None)
+        client.send_request("http://localhost/x", Method.POST, {"a": 1}, {"A": "B"})
+        client.client.request.assert_called_with("POST", "http://localhost/x", json={"a": 1}, headers={"A": "B"})
+
+    def test_response_lazy_json(self):
+        r = Response(b'{"a": 1}')
+        self.assertEqual(r.json(), {"a": 1})
+        self.assertEqual(r, '{"a": 1}')
+
+    def test_http_decorators_with_etag_cache(self):
+        class FakeCache:
+            def __init__(self):
+                self.entries = {("GET", "http://localhost/a/"): ("abc", "cached")}
+            def get(self, method, url):
+                return self.entries.get((method, url))
+            def put(self, method, url, etag, body):
+                self.entries[(method, url)] = (etag, body)
+        response = mock.MagicMock(status_code=304)
+        self.http.send_request = mock.MagicMock(return_value=response)
+        result = WithETagCache(self.http, FakeCache()).send_request("http://localhost/a/", Method.GET, {}, None)
+        self.assertIsInstance(result, Response)
+        self.assertEqual(result, "cached")
+        self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, {"If-None-Match": "abc"})
+
+    def test_http_decorators_with_etag_cache_stores_response_etag(self):
+        class FakeCache:
+            def __init__(self):
+                self.entries = {}
+            def get(self, method, url):
+                return self.entries.get((method, url))
+            def put(self, method, url, etag, body):
+                self.entries[(method, url)] = (etag, body)
+        cache = FakeCache()
+        response = Response(b"body", 200, {"ETag": "abc"})
+        self.http.send_request = mock.MagicMock(return_value=response)
+        result = WithETagCache(self.http, cache).send_request("http://localhost/a/", Method.GET, {}, None)
+        self.assertEqual(result, response)
+        self.http.send_request.assert_called_with("http://localhost/a/", Method.GET, {}, None)
+        self.assertEqual(cache.entries[("GET", "http://localhost/a/")], ("abc", "body"))
\ No newline at end of file